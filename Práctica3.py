@@ -8,8 +8,94 @@ y composición para manejar el conjunto de dispositivos.
 
 # Importamos los módulos necesarios para crear Clases Abstractas (ABC)
 from abc import ABC, abstractmethod
+from array import array
+import atexit
+from contextlib import contextmanager
+from enum import IntEnum
+import sys
 import time
 
+
+class Estado(IntEnum):
+    """
+    Estados posibles de un dispositivo (enteros en lugar de cadenas).
+    Al mostrarse (str o f-string) usa su texto de _NAMES, ej: "apagado".
+    """
+    APAGADO = 0
+    ENCENDIDO = 1
+    STANDBY = 2
+    GRABANDO = 3
+    ACTIVO = 4
+    INACTIVO = 5
+
+    def __str__(self):
+        # Se muestra como texto ("apagado"), igual que antes del enum
+        return _NAMES[self]
+
+    def __format__(self, spec):
+        return format(str(self), spec)
+
+
+# Texto a mostrar para cada Estado, indexado por su valor
+_NAMES = ("apagado", "encendido", "standby", "grabando", "activo", "inactivo")
+
+# Línea separadora de mostrar_todos(), calculada una sola vez
+_SEP = "-" * 30
+
+# --- SALIDA CON BÚFER ---
+# Durante una acción de la casa (mostrar_todos, ejecutar_escena) los
+# mensajes se acumulan en memoria y se escriben de una sola vez (un
+# sys.stdout.write por acción) en lugar de un print() por línea.
+
+_lineas = []    # Mensajes pendientes de la acción en curso
+_agrupando = 0  # Mayor que 0 mientras una acción agrupa su salida
+
+
+def _emit(mensaje):
+    """
+    Escribe un mensaje. Dentro de una acción de la casa se guarda en el
+    búfer; fuera de ella se escribe de inmediato para respetar el orden.
+    """
+    if _agrupando:
+        _lineas.append(mensaje)
+    else:
+        sys.stdout.write(mensaje + "\n")
+
+
+def _flush():
+    """Escribe en stdout los mensajes acumulados y vacía el búfer."""
+    if _lineas:
+        sys.stdout.write("\n".join(_lineas) + "\n")
+        _lineas.clear()
+
+
+@contextmanager
+def _salida_agrupada():
+    """Agrupa los mensajes del bloque y los escribe al terminar, aun si hay error."""
+    global _agrupando
+    _agrupando += 1
+    try:
+        yield
+    finally:
+        _agrupando -= 1
+        if not _agrupando:
+            _flush()
+
+
+# Lo que quede en el búfer se escribe al terminar el programa
+atexit.register(_flush)
+
+
+def _intern_id(id_dispositivo):
+    """
+    Internamos los IDs de tipo str (sys.intern) para que IDs iguales
+    compartan el mismo objeto; cualquier otro tipo se guarda tal cual.
+    """
+    if type(id_dispositivo) is str:
+        return sys.intern(id_dispositivo)
+    return id_dispositivo
+
+
 # --- 1. CLASE ABSTRACTA BASE ---
 
 class Dispositivo(ABC):
@@ -19,16 +105,22 @@ class Dispositivo(ABC):
     
     Atributos:
         _id_dispositivo (str): Identificador único (protegido).
-        _estado (str): Estado actual del dispositivo, ej: "apagado" (protegido).
+        _estado (Estado): Estado actual del dispositivo, ej: Estado.APAGADO (protegido).
+        _display_prefix (str): Inicio fijo de mostrar_datos(), lo arma cada subclase.
+        _cached_line (str | None): Última línea de mostrar_datos(); None si cambió el estado.
     """
+
+    # __slots__ evita el __dict__ por instancia (menos memoria y acceso más rápido)
+    __slots__ = ("_id_dispositivo", "_estado", "_display_prefix", "_cached_line")
     
     def __init__(self, id_dispositivo):
         """Inicializa un nuevo dispositivo."""
         # Usamos guión bajo para indicar que son atributos "protegidos"
         # (convención de Python para atributos internos)
-        self._id_dispositivo = id_dispositivo
-        self._estado = "apagado"
-        print(f"Dispositivo {self._id_dispositivo} creado (estado inicial: {self._estado}).")
+        self._id_dispositivo = _intern_id(id_dispositivo)
+        self._estado = Estado.APAGADO
+        self._cached_line = None
+        _emit(f"Dispositivo {self._id_dispositivo} creado (estado inicial: {_NAMES[self._estado]}).")
 
     # --- Métodos de propiedad (Getters) ---
     # Permiten leer los atributos protegidos de forma segura
@@ -40,7 +132,11 @@ class Dispositivo(ABC):
 
     @property
     def estado(self):
-        """Obtiene el estado actual del dispositivo."""
+        """
+        Obtiene el estado actual del dispositivo como un Estado.
+        Se muestra como texto (str(Estado.APAGADO) == "apagado"), pero
+        para comparar hay que usar el enum: d.estado == Estado.APAGADO.
+        """
         return self._estado
 
     # --- Métodos Abstractos ---
@@ -68,11 +164,15 @@ class LuzInteligente(Dispositivo):
     Subclase para una Luz Inteligente.
     Hereda de Dispositivo.
     """
+
+    __slots__ = ("_intensidad",)
     
     def __init__(self, id_dispositivo, intensidad=0):
         # Llamamos al constructor de la clase padre (Dispositivo)
         super().__init__(id_dispositivo)
         self._intensidad = intensidad
+        # El ID no cambia: armamos una sola vez el inicio de mostrar_datos()
+        self._display_prefix = f"[Luz] ID: {self._id_dispositivo} |"
 
     @property
     def intensidad(self):
@@ -84,27 +184,32 @@ class LuzInteligente(Dispositivo):
         """Establece la intensidad, validando que esté en rango."""
         if 0 <= valor <= 100:
             self._intensidad = valor
-            if self._estado == "encendido":
-                 print(f"Luz {self.id_dispositivo}: Intensidad ajustada al {valor}%.")
+            self._cached_line = None
+            if self._estado == Estado.ENCENDIDO:
+                 _emit(f"Luz {self._id_dispositivo}: Intensidad ajustada al {valor}%.")
         else:
-            print("Error: La intensidad debe estar entre 0 y 100.")
+            _emit("Error: La intensidad debe estar entre 0 y 100.")
 
     def encender(self):
         """Enciende la luz a una intensidad media por defecto."""
-        self._estado = "encendido"
+        self._estado = Estado.ENCENDIDO
         if self._intensidad == 0:
             self._intensidad = 50  # Intensidad por defecto al encender
-        print(f"Luz {self.id_dispositivo} encendida (Intensidad: {self._intensidad}%).")
+        self._cached_line = None
+        _emit(f"Luz {self._id_dispositivo} encendida (Intensidad: {self._intensidad}%).")
 
     def apagar(self):
         """Apaga la luz y pone la intensidad a 0."""
-        self._estado = "apagado"
+        self._estado = Estado.APAGADO
         self._intensidad = 0
-        print(f"Luz {self.id_dispositivo} apagada.")
+        self._cached_line = None
+        _emit(f"Luz {self._id_dispositivo} apagada.")
 
     def mostrar_datos(self):
         """Muestra el estado e intensidad de la luz."""
-        print(f"[Luz] ID: {self.id_dispositivo} | Estado: {self.estado} | Intensidad: {self.intensidad}%")
+        if self._cached_line is None:
+            self._cached_line = f"{self._display_prefix} Estado: {_NAMES[self._estado]} | Intensidad: {self._intensidad}%"
+        _emit(self._cached_line)
 
 
 class CamaraSeguridad(Dispositivo):
@@ -112,10 +217,13 @@ class CamaraSeguridad(Dispositivo):
     Subclase para una Cámara de Seguridad.
     Hereda de Dispositivo.
     """
+
+    __slots__ = ("_grabando",)
     
     def __init__(self, id_dispositivo):
         super().__init__(id_dispositivo)
         self._grabando = False
+        self._display_prefix = f"[Cámara] ID: {self._id_dispositivo} |"
 
     @property
     def grabando(self):
@@ -124,37 +232,43 @@ class CamaraSeguridad(Dispositivo):
 
     def encender(self):
         """Enciende la cámara (modo 'standby')."""
-        self._estado = "standby" # Un estado más específico que "encendido"
-        print(f"Cámara {self.id_dispositivo} encendida (en espera).")
+        self._estado = Estado.STANDBY # Un estado más específico que ENCENDIDO
+        self._cached_line = None
+        _emit(f"Cámara {self._id_dispositivo} encendida (en espera).")
     def apagar(self):
         """Apaga la cámara y detiene cualquier grabación."""
-        self._estado = "apagado"
+        self._estado = Estado.APAGADO
+        self._cached_line = None
         if self._grabando:
             self.detener_grabacion()
-        print(f"Cámara {self.id_dispositivo} apagada.")
+        _emit(f"Cámara {self._id_dispositivo} apagada.")
 
     def iniciar_grabacion(self):
         """Inicia la grabación si la cámara está encendida."""
-        if self._estado == "standby":
+        if self._estado == Estado.STANDBY:
             self._grabando = True
-            self._estado = "grabando"
-            print(f"Cámara {self.id_dispositivo}: ¡GRABANDO!")
-        elif self._estado == "apagado":
-            print(f"Cámara {self.id_dispositivo}: No se puede grabar, está apagada.")
+            self._estado = Estado.GRABANDO
+            self._cached_line = None
+            _emit(f"Cámara {self._id_dispositivo}: ¡GRABANDO!")
+        elif self._estado == Estado.APAGADO:
+            _emit(f"Cámara {self._id_dispositivo}: No se puede grabar, está apagada.")
         else:
-             print(f"Cámara {self.id_dispositivo}: Ya estaba grabando.")
+             _emit(f"Cámara {self._id_dispositivo}: Ya estaba grabando.")
 
     def detener_grabacion(self):
         """Detiene la grabación."""
         if self._grabando:
             self._grabando = False
-            self._estado = "standby" # Vuelve a espera
-            print(f"Cámara {self.id_dispositivo}: Grabación detenida.")
+            self._estado = Estado.STANDBY # Vuelve a espera
+            self._cached_line = None
+            _emit(f"Cámara {self._id_dispositivo}: Grabación detenida.")
 
     def mostrar_datos(self):
         """Muestra el estado y si está grabando."""
-        estado_grabacion = "Sí" if self.grabando else "No"
-        print(f"[Cámara] ID: {self.id_dispositivo} | Estado: {self.estado} | Grabando: {estado_grabacion}")
+        if self._cached_line is None:
+            estado_grabacion = "Sí" if self._grabando else "No"
+            self._cached_line = f"{self._display_prefix} Estado: {_NAMES[self._estado]} | Grabando: {estado_grabacion}"
+        _emit(self._cached_line)
 
 
 class SensorMovimiento(Dispositivo):
@@ -162,10 +276,13 @@ class SensorMovimiento(Dispositivo):
     Subclase para un Sensor de Movimiento.
     Hereda de Dispositivo.
     """
+
+    __slots__ = ("_movimiento_detectado",)
     
-    def _init_(self, id_dispositivo):
-        super()._init_(id_dispositivo)
+    def __init__(self, id_dispositivo):
+        super().__init__(id_dispositivo)
         self._movimiento_detectado = False
+        self._display_prefix = f"[Sensor] ID: {self._id_dispositivo} |"
 
     @property
     def movimiento_detectado(self):
@@ -174,29 +291,104 @@ class SensorMovimiento(Dispositivo):
 
     def encender(self):
         """Activa el sensor."""
-        self._estado = "activo"
+        self._estado = Estado.ACTIVO
         self._movimiento_detectado = False # Resetea al activar
-        print(f"Sensor {self.id_dispositivo} activado.")
+        self._cached_line = None
+        _emit(f"Sensor {self._id_dispositivo} activado.")
         
     def apagar(self):
         """Desactiva el sensor."""
-        self._estado = "inactivo"
+        self._estado = Estado.INACTIVO
         self._movimiento_detectado = False
-        print(f"Sensor {self.id_dispositivo} desactivado.")
+        self._cached_line = None
+        _emit(f"Sensor {self._id_dispositivo} desactivado.")
     
     
     def simular_movimiento(self):
         """Simula la detección de movimiento."""
-        if self._estado == "activo":
+        if self._estado == Estado.ACTIVO:
             self._movimiento_detectado = True
-            print(f"Sensor {self.id_dispositivo}: ¡¡MOVIMIENTO DETECTADO!!")
+            self._cached_line = None
+            _emit(f"Sensor {self._id_dispositivo}: ¡¡MOVIMIENTO DETECTADO!!")
         else:
-            print(f"Sensor {self.id_dispositivo}: Está inactivo, no puede detectar.")
+            _emit(f"Sensor {self._id_dispositivo}: Está inactivo, no puede detectar.")
 
     def mostrar_datos(self):
         """Muestra el estado del sensor y si hay detección."""
-        deteccion = "Sí" if self.movimiento_detectado else "No"
-        print(f"[Sensor] ID: {self.id_dispositivo} | Estado: {self.estado} | Movimiento Detectado: {deteccion}")
+        if self._cached_line is None:
+            deteccion = "Sí" if self._movimiento_detectado else "No"
+            self._cached_line = f"{self._display_prefix} Estado: {_NAMES[self._estado]} | Movimiento Detectado: {deteccion}"
+        _emit(self._cached_line)
+
+
+class BulkSensorArray:
+    """
+    Conjunto compacto de muchos sensores de movimiento.
+    En lugar de un objeto SensorMovimiento por sensor, guarda el estado
+    y la detección de todos en arreglos de bytes (array('B')); cada
+    sensor se identifica por su índice dentro del conjunto.
+    """
+
+    __slots__ = ("_ids", "_estados", "_moved")
+
+    def __init__(self, ids):
+        self._ids = [_intern_id(id_dispositivo) for id_dispositivo in ids]
+        n = len(self._ids)
+        self._estados = array("B", bytes(n))  # Todos en Estado.APAGADO (0)
+        self._moved = array("B", bytes(n))
+        _emit(f"Arreglo de {n} sensores creado (estado inicial: {_NAMES[Estado.APAGADO]}).")
+
+    def __len__(self):
+        return len(self._ids)
+
+    def id_dispositivo(self, i):
+        """Obtiene el ID del sensor i."""
+        return self._ids[i]
+
+    def estado(self, i):
+        """Obtiene el estado actual del sensor i (un Estado)."""
+        return Estado(self._estados[i])
+
+    def movimiento_detectado(self, i):
+        """Indica si el sensor i detectó movimiento recientemente."""
+        return self._moved[i] == 1
+
+    def encender(self, i):
+        """Activa el sensor i."""
+        self._estados[i] = Estado.ACTIVO
+        self._moved[i] = 0 # Resetea al activar
+        _emit(f"Sensor {self._ids[i]} activado.")
+
+    def apagar(self, i):
+        """Desactiva el sensor i."""
+        self._estados[i] = Estado.INACTIVO
+        self._moved[i] = 0
+        _emit(f"Sensor {self._ids[i]} desactivado.")
+
+    def simular_movimiento(self, i):
+        """Simula la detección de movimiento en el sensor i."""
+        if self._estados[i] == Estado.ACTIVO:
+            self._moved[i] = 1
+            _emit(f"Sensor {self._ids[i]}: ¡¡MOVIMIENTO DETECTADO!!")
+        else:
+            _emit(f"Sensor {self._ids[i]}: Está inactivo, no puede detectar.")
+
+    def primer_movimiento(self):
+        """Devuelve el índice del primer sensor con movimiento, o None."""
+        try:
+            return self._moved.index(1)  # Recorre los bytes contiguos en C
+        except ValueError:
+            return None
+
+    def mostrar_datos(self, i):
+        """Muestra el estado del sensor i y si hay detección."""
+        deteccion = "Sí" if self._moved[i] else "No"
+        _emit(f"[Sensor] ID: {self._ids[i]} | Estado: {_NAMES[self._estados[i]]} | Movimiento Detectado: {deteccion}")
+
+    def mostrar_todos(self):
+        """Muestra el estado de todos los sensores del arreglo."""
+        for i in range(len(self._ids)):
+            self.mostrar_datos(i)
 
 
 # --- 3. CLASE DE COMPOSICIÓN ---
@@ -206,88 +398,172 @@ class CasaInteligente:
     Clase que gestiona todos los dispositivos de la casa.
     Utiliza composición (tiene una lista de objetos Dispositivo).
     """
+
+    # Escenas disponibles: nombre -> nombre del método que la ejecuta
+    _SCENES = {
+        "alerta_movimiento": "_alerta_movimiento",
+    }
     
-    def _init_(self, nombre):
+    def __init__(self, nombre):
         self.nombre = nombre
-        self._dispositivos = []  # Lista para almacenar los dispositivos
-        print(f"Casa Inteligente '{nombre}' creada.")
+        # Registro de todo lo agregado (Dispositivos y BulkSensorArray)
+        self._dispositivos = []
+        # Listas por tipo, llenadas al agregar, para no recorrer ni usar
+        # isinstance() sobre todos los dispositivos en cada escena
+        self._luces = []
+        self._camaras = []
+        self._sensores = []
+        self._sensores_bulk = []  # Objetos BulkSensorArray completos
+        self._listas_por_tipo = {
+            LuzInteligente: self._luces,
+            CamaraSeguridad: self._camaras,
+            SensorMovimiento: self._sensores,
+        }
+        # Métodos mostrar_datos() ya enlazados, en el orden de agregado
+        self._mostrar_fns = []
+        _emit(f"Casa Inteligente '{nombre}' creada.")
 
     def agregar_dispositivo(self, dispositivo):
-        """Agrega un dispositivo a la casa."""
+        """
+        Agrega un dispositivo a la casa.
+        Acepta un Dispositivo o un BulkSensorArray completo.
+        """
+        if isinstance(dispositivo, BulkSensorArray):
+            # Se registra el arreglo una sola vez, no cada sensor
+            self._dispositivos.append(dispositivo)
+            self._sensores_bulk.append(dispositivo)
+            self._mostrar_fns.append(dispositivo.mostrar_todos)
+            _emit(f"Arreglo de {len(dispositivo)} sensores agregado a '{self.nombre}'.")
         # Verificamos que sea un Dispositivo antes de agregarlo
-        if isinstance(dispositivo, Dispositivo):
+        elif isinstance(dispositivo, Dispositivo):
             self._dispositivos.append(dispositivo)
-            print(f"Dispositivo '{dispositivo.id_dispositivo}' agregado a '{self.nombre}'.")
+            # Camino rápido: buscar el tipo exacto en el diccionario; el
+            # isinstance() de abajo cubre las subclases que defina el usuario
+            lista = self._listas_por_tipo.get(type(dispositivo))
+            if lista is None:
+                # Subclase de Luz/Cámara/Sensor: buscamos su tipo base
+                for tipo, candidata in self._listas_por_tipo.items():
+                    if isinstance(dispositivo, tipo):
+                        lista = candidata
+                        break
+            if lista is not None:
+                lista.append(dispositivo)
+            self._mostrar_fns.append(dispositivo.mostrar_datos)
+            _emit(f"Dispositivo '{dispositivo.id_dispositivo}' agregado a '{self.nombre}'.")
         else:
-            print("Error: Solo se pueden agregar objetos que hereden de 'Dispositivo'.")
+            _emit("Error: Solo se pueden agregar objetos que hereden de 'Dispositivo' "
+                  "o arreglos 'BulkSensorArray'.")
 
     def mostrar_todos(self):
         """Muestra el estado de todos los dispositivos en la casa."""
-        print("-" * 30)
-        print(f"Estado de Dispositivos en: {self.nombre}")
-        print("-" * 30)
-        if not self._dispositivos:
-            print("No hay dispositivos registrados en la casa.")
-            return
-
- for d in self._dispositivos:
-            # Polimorfismo en acción:
-            # Python llama al método mostrar_datos() de la clase
-            # correcta (Luz, Camara, Sensor) automáticamente.
-            d.mostrar_datos()
-        print("-" * 30)
+        with _salida_agrupada():
+            _emit(_SEP)
+            _emit(f"Estado de Dispositivos en: {self.nombre}")
+            _emit(_SEP)
+            if not self._dispositivos:
+                _emit("No hay dispositivos registrados en la casa.")
+                return
+
+            for mostrar in self._mostrar_fns:
+                # Polimorfismo en acción:
+                # cada método enlazado es el mostrar_datos() de la clase
+                # correcta (Luz, Camara, Sensor), resuelto al agregar.
+                mostrar()
+            _emit(_SEP)
 
     def ejecutar_escena(self, nombre_escena):
         """
         Ejecuta una acción coordinada basada en el estado de los dispositivos.
         Ejemplo: "Si hay movimiento, enciende luces y graba."
         """
-        print(f"\n>>> Ejecutando Escena: '{nombre_escena}' <<<")
-        
-        if nombre_escena == "alerta_movimiento":
-            sensor_activado = None
+        with _salida_agrupada():
+            _emit(f"\n>>> Ejecutando Escena: '{nombre_escena}' <<<")
             
-            # 1. Buscar si algún sensor detectó movimiento
-            for d in self._dispositivos:
-                if isinstance(d, SensorMovimiento) and d.movimiento_detectado:
-                    sensor_activado = d
-                    break # Encontramos uno, salimos del bucle
+            # Buscamos la escena en el diccionario (en vez de una cadena de if/elif)
+            try:
+                metodo = self._SCENES.get(nombre_escena)
+            except TypeError:  # Nombre no hashable (ej. una lista)
+                metodo = None
+            if metodo is not None:
+                # getattr respeta los métodos redefinidos en subclases
+                getattr(self, metodo)()
+            else:
+                _emit(f"Escena '{nombre_escena}' no reconocida.")
+
+    def _alerta_movimiento(self):
+        """Si algún sensor detectó movimiento, enciende luces y graba."""
+        # 1. Buscar el primer sensor que detectó movimiento.
+        # Prioridad: primero los SensorMovimiento y luego los arreglos
+        # BulkSensorArray, cada grupo en el orden en que se agregó.
+        sensor_activado = next((s for s in self._sensores if s._movimiento_detectado), None)
+        if sensor_activado is not None:
+            id_activado = sensor_activado._id_dispositivo
+        else:
+            id_activado = next((a.id_dispositivo(i) for a in self._sensores_bulk
+                                if (i := a.primer_movimiento()) is not None), None)
+        
+        # 2. Si hubo detección, activar otros dispositivos
+        if id_activado is not None:
+            _emit(f"ALERTA: Movimiento detectado por {id_activado}.")
+            _emit("Acción: Encendiendo luces y activando cámaras...")
             
-            # 2. Si hubo detección, activar otros dispositivos
-            if sensor_activado:
-                print(f"ALERTA: Movimiento detectado por {sensor_activado.id_dispositivo}.")
-                print("Acción: Encendiendo luces y activando cámaras...")
+            # Encender todas las luces al 100%
+            for d in self._luces:
+                d.encender()
+                d.intensidad = 100
+
+            # Iniciar grabación en todas las cámaras
+            for d in self._camaras:
+                # La cámara debe estar encendida (standby) para grabar
+                if d.estado == Estado.APAGADO:
+                    d.encender() 
                 
-                for d in self._dispositivos:
-                    # Si es una luz, encenderla al 100%
-                    if isinstance(d, LuzInteligente):
-                        d.encender()
-                        d.intensidad = 100
-                    
-                    # Si es una cámara, iniciar grabación
-                    if isinstance(d, CamaraSeguridad):
-                        # La cámara debe estar encendida (standby) para grabar
-                        if d.estado == "apagado":
-                            d.encender() 
-                        
-                        d.iniciar_grabacion()
-            else:
-                print("Escena 'alerta_movimiento' verificada. No se detectó movimiento.")
+                d.iniciar_grabacion()
         else:
-            print(f"Escena '{nombre_escena}' no reconocida.")
+            _emit("Escena 'alerta_movimiento' verificada. No se detectó movimiento.")
+
+    def flush(self):
+        """Escribe en pantalla todos los mensajes pendientes."""
+        _flush()
 
 
 # --- 4. SIMULACIÓN (Bloque principal) ---
 
+def demo_sensores_en_arreglo():
+    """
+    Demostración aparte de BulkSensorArray (se ejecuta con --bulk):
+    agrega un arreglo de sensores, detecta movimiento, ejecuta la
+    escena y muestra el estado.
+    """
+    _emit("\n===== DEMO: SENSORES EN ARREGLO (BulkSensorArray) =====")
+    casa = CasaInteligente("Casa con Jardín")
+    luz_jardin = LuzInteligente("LUZ-JARDIN-01")
+    sensores_jardin = BulkSensorArray(["SEN-JARDIN-01", "SEN-JARDIN-02", "SEN-JARDIN-03"])
+    casa.agregar_dispositivo(luz_jardin)
+    casa.agregar_dispositivo(sensores_jardin)
+
+    for i in range(len(sensores_jardin)):
+        sensores_jardin.encender(i)
+    sensores_jardin.simular_movimiento(1)
+
+    casa.ejecutar_escena("alerta_movimiento")
+    casa.mostrar_todos()
+
+
 # Esto asegura que el código solo se ejecute si el script es
 # el archivo principal (y no si es importado por otro script).
-if _name_ == "_main_":
+if __name__ == "__main__":
+
+    # Las pausas entre pasos solo se hacen si se pide con --pace
+    PACE_ENABLED = "--pace" in sys.argv
+    # La demo de BulkSensorArray solo se ejecuta si se pide con --bulk
+    BULK_DEMO_ENABLED = "--bulk" in sys.argv
     
-    print("===== INICIANDO SIMULACIÓN DE CASA INTELIGENTE =====")
+    _emit("===== INICIANDO SIMULACIÓN DE CASA INTELIGENTE =====")
     
     # 1. Crear la casa
     mi_casa = CasaInteligente("Hogar Principal")
-    print("=" * 50)
+    _emit("=" * 50)
 
     # 2. Crear los 5 dispositivos
     luz_sala = LuzInteligente("LUZ-SALA-01")
@@ -297,7 +573,7 @@ if _name_ == "_main_":
     camara_patio = CamaraSeguridad("CAM-PATIO-01")
 
     # 3. Agregarlos a la casa
-    print("\n===== Agregando Dispositivos =====")
+    _emit("\n===== Agregando Dispositivos =====")
     mi_casa.agregar_dispositivo(luz_sala)
     mi_casa.agregar_dispositivo(luz_cocina)
     mi_casa.agregar_dispositivo(sensor_puerta)
@@ -308,7 +584,7 @@ if _name_ == "_main_":
     mi_casa.mostrar_todos()
 
     # 5. Simular lecturas y encendidos
-    print("\n===== Simulación de Uso Diario =====")
+    _emit("\n===== Simulación de Uso Diario =====")
     
     # Encendemos los dispositivos que deben estar activos
     sensor_puerta.encender()
@@ -316,26 +592,31 @@ if _name_ == "_main_":
     luz_sala.encender()
     luz_sala.intensidad = 20 # Luz tenue
     
-    # Pausa para ver la simulación
-    time.sleep(1) 
+    # Pausa para ver la simulación (solo con --pace)
+    if PACE_ENABLED:
+        time.sleep(1)
 
     # 6. Ejecutar escena SIN movimiento
     mi_casa.ejecutar_escena("alerta_movimiento")
     mi_casa.mostrar_todos()
     
     # 7. Simular detección de movimiento
-    print("\n===== ¡Simulando Movimiento! =====")
+    _emit("\n===== ¡Simulando Movimiento! =====")
     sensor_puerta.simular_movimiento()
     
-     # Pausa para ver la simulación
-    time.sleep(1)
+    # Pausa para ver la simulación (solo con --pace)
+    if PACE_ENABLED:
+        time.sleep(1)
 
     # 8. Ejecutar escena DE NUEVO (ahora sí debe reaccionar)
     mi_casa.ejecutar_escena("alerta_movimiento")
     
     # 9. Mostrar estado final
-    print("\n===== Estado Final de la Casa =====")
+    _emit("\n===== Estado Final de la Casa =====")
     mi_casa.mostrar_todos()
     
-    print("===== FIN DE LA SIMULACIÓN =====")
+    _emit("===== FIN DE LA SIMULACIÓN =====")
 
+    # Demostración opcional de BulkSensorArray, fuera del flujo principal
+    if BULK_DEMO_ENABLED:
+        demo_sensores_en_arreglo()